@@ -6,11 +6,18 @@ documentation: https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import os
 import shutil
 import subprocess  # noqa: S404
 import sys
+from glob import glob
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, ClassVar
+from urllib.request import urlopen
 
+from docutils.parsers.rst import Directive, directives
 from sphinx_api_relink.helpers import (
     get_execution_mode,
     pin,
@@ -19,6 +26,10 @@ from sphinx_api_relink.helpers import (
 )
 from sphinx_api_relink.linkcode import _get_commit_sha
 
+if TYPE_CHECKING:
+    from docutils import nodes
+    from sphinx.application import Sphinx
+
 sys.path.insert(0, os.path.abspath("."))
 import _list_technical_reports
 
@@ -51,9 +62,35 @@ def get_nb_exclusion_patterns() -> list[str]:
     }
     if shutil.which("julia") is None or "READTHEDOCS" in os.environ:
         exclusions.update(julia_notebooks)
+    shard = os.environ.get("COMPWA_SHARD")
+    if shard is not None:
+        exclusions.update(get_notebooks_outside_shard(shard, exclusions))
     return sorted(exclusions)
 
 
+def get_notebooks_outside_shard(shard: str, exclusions: set[str]) -> set[str]:
+    msg = f"COMPWA_SHARD should be of the form i/n, got {shard!r}"
+    try:
+        index, n_shards = map(int, shard.split("/"))
+    except ValueError:
+        raise ValueError(msg) from None
+    if not (n_shards >= 1 and 0 <= index < n_shards):
+        raise ValueError(msg)
+    notebooks = sorted(
+        PurePosixPath(Path(path).as_posix())
+        for path in glob("**/*.ipynb", recursive=True)
+        if not path.startswith("_build")
+    )
+    executed_notebooks = [
+        path
+        for path in notebooks
+        if not any(path.match(pattern) for pattern in exclusions)
+    ]
+    return {
+        str(path) for i, path in enumerate(executed_notebooks) if i % n_shards != index
+    }
+
+
 def install_ijulia() -> None:
     if shutil.which("julia") is None:
         return
@@ -61,7 +98,53 @@ def install_ijulia() -> None:
         subprocess.check_call(["julia", "InstallIJulia.jl"])  # noqa: S603, S607
 
 
-_list_technical_reports.main()
+def vendor_static_file(url: str, integrity: str) -> str | tuple[str, dict[str, str]]:
+    filename = os.path.basename(url)
+    path = f"_static/{filename}"
+    if os.path.exists(path):
+        with open(path, "rb") as stream:
+            if _compute_integrity(stream.read()) == integrity:
+                return filename
+    cdn_entry = (url, {"integrity": integrity, "crossorigin": "anonymous"})
+    try:
+        with urlopen(url, timeout=10) as response:  # noqa: S310
+            content = response.read()
+    except OSError:
+        return cdn_entry
+    if _compute_integrity(content) != integrity:
+        return cdn_entry
+    with open(path, "wb") as stream:
+        stream.write(content)
+    return filename
+
+
+def _compute_integrity(content: bytes) -> str:
+    digest = hashlib.sha256(content).digest()
+    return f"sha256-{base64.b64encode(digest).decode()}"
+
+
+class AutolinkPlaceholder(Directive):
+    """Ignore `sphinx_codeautolink` directives if that extension is disabled."""
+
+    has_content = True
+    optional_arguments = 1
+    final_argument_whitespace = True
+    option_spec: ClassVar[dict] = {
+        "collapse": directives.flag,
+        "type": directives.unchanged,
+    }
+
+    def run(self) -> list[nodes.Node]:  # noqa: PLR6301
+        return []
+
+
+def setup(app: Sphinx) -> None:
+    app.connect("builder-inited", lambda _: _list_technical_reports.main())
+    if "sphinx_codeautolink" not in extensions:
+        for name in ("concat", "examples", "preface", "skip"):
+            app.add_directive(f"autolink-{name}", AutolinkPlaceholder)
+
+
 install_ijulia()
 set_intersphinx_version_remapping({
     "ipython": {
@@ -79,6 +162,7 @@ set_intersphinx_version_remapping({
 })
 
 BRANCH = _get_commit_sha()
+EXECUTION_MODE = get_execution_mode()
 ORGANIZATION = "ComPWA"
 REPO_NAME = "compwa.github.io"
 REPO_TITLE = "ComPWA Organization"
@@ -90,13 +174,6 @@ BINDER_LINK = (
 autosectionlabel_prefix_document = True
 bibtex_bibfiles = ["bibliography.bib"]
 bibtex_reference_style = "author_year"
-codeautolink_concat_default = True
-codeautolink_global_preface = """
-import matplotlib.pyplot as plt
-import numpy as np
-import sympy as sp
-from IPython.display import display
-"""
 comments_config = {
     "hypothesis": True,
     "utterances": {
@@ -124,7 +201,7 @@ extensions = [
     "sphinx.ext.napoleon",
     "sphinx.ext.todo",
     "sphinx_api_relink",
-    "sphinx_codeautolink",
+    *([] if "COMPWA_FAST" in os.environ else ["sphinx_codeautolink"]),
     "sphinx_comments",
     "sphinx_copybutton",
     "sphinx_design",
@@ -141,8 +218,11 @@ html_css_files = [
 ]
 html_favicon = "_static/favicon.ico"
 html_js_files = [
-    "https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js",
-    "https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.4/require.min.js",
+    "https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js",  # no pinned hash
+    vendor_static_file(
+        "https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.4/require.min.js",
+        integrity="sha256-Ae2Vz/4ePdIu6ZyI/5ZGsYnb+m0JlOmKPjt6XZ9JJkA=",
+    ),
 ]
 html_last_updated_fmt = "%-d %B %Y"
 html_logo = (
@@ -236,6 +316,7 @@ linkcheck_ignore = [
     r"https://github.com/ComPWA/RUB-EP1-AG/.*",  # private
     r"https://github.com/orgs/ComPWA/projects/\d+",  # private
 ]
+linkcheck_workers = 16
 myst_enable_extensions = [
     "amsmath",
     "colon_fence",
@@ -249,7 +330,7 @@ myst_substitutions = {
     "remark_019": (
         "Notice how a new file [`019/Project.toml`](./019/Project.toml) and "
         " [`019/Manifest.toml`](./019/Manifest.toml) are automatically generated."
-        if get_execution_mode() != "off"
+        if EXECUTION_MODE != "off"
         else ""
     ),
     "run_interactive": f"""
@@ -262,11 +343,11 @@ modify the parameters.
 }
 myst_update_mathjax = False
 nb_execution_excludepatterns = get_nb_exclusion_patterns()
-nb_execution_mode = get_execution_mode()
+nb_execution_mode = EXECUTION_MODE
 nb_execution_show_tb = True
 nb_execution_timeout = -1
 nb_output_stderr = "remove"
-nitpicky = True
+nitpicky = "COMPWA_NO_NITPICKY" not in os.environ
 primary_domain = "py"
 project = REPO_TITLE
 remove_from_toctrees = [
@@ -286,3 +367,12 @@ thebe_config = {
     "repository_branch": html_theme_options["repository_branch"],
 }
 todo_include_todos = True
+
+if "sphinx_codeautolink" in extensions:
+    codeautolink_concat_default = True
+    codeautolink_global_preface = """
+import matplotlib.pyplot as plt
+import numpy as np
+import sympy as sp
+from IPython.display import display
+"""